@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Compute PSI and KS over time for Chapter 2: psi_over_time.csv
+Scores every partition of the ride store against the frozen baseline, in parallel
+across a process pool. Partitions already present in the output are kept as-is,
+so after appending new partitions only those are scored.
+
+Small partitions (e.g. hourly) get fewer PSI bins, at least ROWS_PER_BIN rows each,
+so sampling noise alone does not read as drift; partitions below --min-rows are
+skipped and retried on the next run.
+
+Usage:
+    python3 scripts/compute_psi_over_time.py            # score new partitions only
+    python3 scripts/compute_psi_over_time.py --full     # rescore everything
+"""
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.stats import ks_2samp
+
+from ride_store import STORE_DIR, read_index, read_partition
+
+FIXTURES_DIR = Path(__file__).parent.parent / "public" / "chapters" / "chapter-2" / "fixtures"
+FEATURES = ["trip_distance_km", "surge_multiplier", "fare_amount"]
+OUTPUT_COLUMNS = ["date", "feature", "psi", "ks_stat", "ks_pvalue", "rows", "bins"]
+BINS = 10
+MIN_BINS = 2
+ROWS_PER_BIN = 10
+MIN_ROWS = 20
+PSEUDOCOUNT = 0.5  # added to every bin count so empty bins don't dominate PSI
+
+# Frozen baseline reference, set once per worker process by _init_worker
+_reference = None
+
+
+def build_reference(df_baseline, bins=BINS):
+    """
+    Freeze the baseline per feature: quantile bin edges and expected bin
+    proportions for every bin count from MIN_BINS to `bins`, and the raw
+    sample for KS.
+    """
+    reference = {}
+    for feat in FEATURES:
+        values = df_baseline[feat].dropna().to_numpy()
+        binnings = {}
+        for k in range(MIN_BINS, bins + 1):
+            edges = np.unique(np.quantile(values, np.linspace(0, 1, k + 1)))
+            # Open outer bins so partition values outside the baseline range still count
+            edges[0], edges[-1] = -np.inf, np.inf
+            binnings[k] = (edges, _proportions(values, edges))
+        reference[feat] = {"binnings": binnings, "values": values}
+    return reference
+
+
+def _proportions(values, edges):
+    counts = np.histogram(values, bins=edges)[0].astype(float)
+    return (counts + PSEUDOCOUNT) / (counts.sum() + len(counts) * PSEUDOCOUNT)
+
+
+def _init_worker(reference):
+    global _reference
+    _reference = reference
+
+
+def score_partition(store_dir, key, path):
+    """PSI and KS for each feature of one partition against the frozen baseline."""
+    df = read_partition(path, store_dir)
+    rows = []
+    for feat in FEATURES:
+        ref = _reference[feat]
+        values = df[feat].dropna().to_numpy()
+        bins = max(MIN_BINS, min(len(values) // ROWS_PER_BIN, max(ref["binnings"])))
+        edges, expected = ref["binnings"][bins]
+        actual = _proportions(values, edges)
+        ks_stat, ks_p = ks_2samp(ref["values"], values)
+        rows.append({
+            "date": key,
+            "feature": feat,
+            "psi": float(np.sum((actual - expected) * np.log(actual / expected))),
+            "ks_stat": float(ks_stat),
+            "ks_pvalue": float(ks_p),
+            "rows": len(values),
+            "bins": len(expected),
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--store", type=Path, default=STORE_DIR, help="partitioned store directory")
+    parser.add_argument("--baseline", type=Path, default=FIXTURES_DIR / "rides_baseline.csv")
+    parser.add_argument("--output", type=Path, default=FIXTURES_DIR / "psi_over_time.csv")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="process pool size")
+    parser.add_argument("--bins", type=int, default=BINS, help=f"max PSI bins per feature (default: {BINS})")
+    parser.add_argument("--min-rows", type=int, default=MIN_ROWS,
+                        help=f"skip partitions with fewer rows (default: {MIN_ROWS})")
+    parser.add_argument("--full", action="store_true", help="rescore all partitions")
+    args = parser.parse_args()
+    if args.bins < MIN_BINS:
+        parser.error(f"--bins must be at least {MIN_BINS}, got {args.bins}")
+
+    index = read_index(args.store)
+    if index.empty:
+        parser.error(f"No partitions in {args.store}; run generate_chapter2_data.py first")
+
+    # Keep previous scores for partitions still in the store, unless rescoring everything
+    if args.output.exists() and not args.full:
+        done = pd.read_csv(args.output, dtype={"date": str}, float_precision="round_trip")
+        done = done[done["date"].isin(index["partition"])]
+        if list(done.columns) != OUTPUT_COLUMNS:
+            print(f"{args.output} has an older column layout; rescoring all partitions")
+            done = pd.DataFrame(columns=OUTPUT_COLUMNS)
+    else:
+        done = pd.DataFrame(columns=OUTPUT_COLUMNS)
+    todo = index[~index["partition"].isin(done["date"])]
+    too_small = todo["rows"] < args.min_rows
+    todo = todo[~too_small]
+
+    print(f"Store has {len(index)} partitions; {len(done['date'].unique())} already scored, "
+          f"{len(todo)} to score, {too_small.sum()} skipped (< {args.min_rows} rows)")
+
+    scored = []
+    if len(todo):
+        print(f"Loading baseline from {args.baseline}...")
+        reference = build_reference(pd.read_csv(args.baseline), bins=args.bins)
+        workers = max(1, min(args.workers, len(todo)))
+        print(f"Scoring with {workers} worker process(es)...")
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(reference,)) as pool:
+            results = pool.map(
+                score_partition,
+                [args.store] * len(todo),
+                todo["partition"],
+                todo["path"],
+            )
+            for rows in results:
+                scored.extend(rows)
+
+    frames = [f for f in (done, pd.DataFrame(scored, columns=OUTPUT_COLUMNS)) if len(f)]
+    if not frames:
+        print("Nothing scored yet; no output written")
+        return
+    df_out = pd.concat(frames, ignore_index=True).sort_values(["date", "feature"])
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    df_out.to_csv(args.output, index=False)
+    print(f"✅ Wrote {args.output} ({len(df_out)} rows)")
+
+    # Print latest partition summary
+    latest = df_out[df_out["date"] == df_out["date"].max()]
+    print(f"\nLatest partition: {latest['date'].iloc[0]}")
+    print(f"{'Feature':<25} {'PSI':<10} {'KS':<10} {'p-value':<10}")
+    print("-" * 55)
+    for _, row in latest.iterrows():
+        print(f"{row['feature']:<25} {row['psi']:<10.4f} {row['ks_stat']:<10.4f} {row['ks_pvalue']:<10.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,46 @@
 #!/usr/bin/env python3
 """
-Generate CSV fixtures for Chapter 2: rides_rainstorm.csv
+Generate fixtures for Chapter 2: rides_rainstorm.csv and the partitioned ride stream
 Uses baseline from Chapter 1 and generates rainstorm data with shifted distributions.
+The stream covers the days after the baseline, drifting gradually half-way towards
+rainstorm conditions, and is written to the date-partitioned store (see ride_store.py).
+
+Usage:
+    python3 scripts/generate_chapter2_data.py                 # rebuild 14 daily partitions
+    python3 scripts/generate_chapter2_data.py --freq h        # hourly partitions instead
+    python3 scripts/generate_chapter2_data.py --append 3      # add 3 more days to the store
 """
+import argparse
+
 import numpy as np
 import pandas as pd
 from pathlib import Path
 
+from ride_store import INDEX_FILE, STORE_DIR, clear_store, read_index, write_partitions
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument("--days", type=int, help="days of stream to generate (default: 14)")
+parser.add_argument("--freq", choices=["D", "h"], help="partition granularity (default: D)")
+parser.add_argument("--append", type=int, metavar="N", help="append N days after the last stored day")
+parser.add_argument("--store", type=Path, default=STORE_DIR, help="partitioned store directory")
+args = parser.parse_args()
+
+# Validate before writing anything: a bad flag must never touch an existing store
+if args.append is not None:
+    if args.append < 1:
+        parser.error(f"--append must be at least 1, got {args.append}")
+    if args.freq is not None or args.days is not None:
+        parser.error("--freq and --days cannot be combined with --append (the store fixes them)")
+    if read_index(args.store).empty:
+        parser.error(f"--append needs an existing store, none found at {args.store}")
+else:
+    args.days = 14 if args.days is None else args.days
+    args.freq = args.freq or "D"
+    if args.days < 1:
+        parser.error(f"--days must be at least 1, got {args.days}")
+    if args.store.exists() and any(args.store.iterdir()) and not (args.store / INDEX_FILE).exists():
+        parser.error(f"{args.store} is not empty and has no {INDEX_FILE}; refusing to overwrite it")
+
 # Set up output directory (public is served by Next.js)
 output_dir = Path(__file__).parent.parent / "public" / "chapters" / "chapter-2" / "fixtures"
 output_dir.mkdir(parents=True, exist_ok=True)
@@ -50,4 +84,53 @@ for col in ["trip_distance_km", "surge_multiplier", "fare_amount"]:
     rainstorm_mean = df_rainstorm[col].mean()
     print(f"{col:<25} {baseline_mean:<12.3f} {rainstorm_mean:<12.3f}")
 
+# ====== Partitioned ride stream ======
+# One day of rides every 2 minutes, starting the day after the baseline ends.
+# Each day is seeded by its offset, so appending days yields exactly the rows
+# a full rebuild would have produced for them.
+STREAM_START = pd.Timestamp("2025-09-05")
+RIDES_PER_DAY = 720
+RAMP_DAYS = 13  # days until the drift plateaus
+RAMP_SHIFT = 0.5  # fraction of the rainstorm shift reached; keeps daily PSI within the 0–0.5 chart
+
+
+def generate_stream_day(day):
+    """Rides for stream day `day`, interpolating baseline → rainstorm conditions."""
+    day_rng = np.random.default_rng([9, day])
+    t = RAMP_SHIFT * min(day / RAMP_DAYS, 1.0)
+    n = RIDES_PER_DAY
+
+    trip = np.clip(day_rng.normal(6.5 + 1.3 * t, 2.0 + 0.5 * t, n), 0.3, None)
+    surge = np.clip(day_rng.lognormal(mean=0.05 + 0.07 * t, sigma=0.15 + 0.05 * t, size=n), 1.0, None)
+    fare = np.clip(35 + 3 * t + trip * (3.2 + 0.3 * t) + day_rng.normal(0, 5 + t, n), 5, None)
+
+    return pd.DataFrame({
+        "ride_id": [f"s{day}_{i}" for i in range(n)],
+        "timestamp": pd.date_range(STREAM_START + pd.Timedelta(days=day), periods=n, freq="2min"),
+        "pickup_zone": day_rng.choice([f"Z{i:03d}" for i in range(40)], size=n),
+        "dropoff_zone": day_rng.choice([f"Z{i:03d}" for i in range(40)], size=n),
+        "trip_distance_km": trip,
+        "surge_multiplier": surge,
+        "fare_amount": fare,
+    })
+
+
+if args.append is not None:
+    index = read_index(args.store)
+    freq = index["freq"].iloc[0]
+    last_day = pd.Timestamp(index["max_timestamp"].max()).normalize()
+    first = (last_day - STREAM_START).days + 1
+    days = range(first, first + args.append)
+else:
+    # Full rebuild: drop stale partitions so the index matches the stream exactly
+    freq = args.freq
+    clear_store(args.store)
+    days = range(args.days)
+
+print(f"\nWriting {len(days)} day(s) of rides to {args.store} (freq={freq})...")
+df_stream = pd.concat([generate_stream_day(day) for day in days], ignore_index=True)
+written = write_partitions(df_stream, args.store, freq=freq)
+print(f"✅ Wrote {len(written)} partitions ({len(df_stream)} rows), "
+      f"{written['partition'].iloc[0]} → {written['partition'].iloc[-1]}")
+
 print("\nDone!")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Date-partitioned columnar store for ride data.
+
+Layout (Hive-style, one Parquet file per partition):
+
+    <store>/date=2025-09-05/part.parquet               (freq="D")
+    <store>/date=2025-09-05/hour=13/part.parquet       (freq="h")
+    <store>/_index.csv                                 partition index
+
+The index lists every partition with its relative path, row count and
+timestamp range, so readers never have to walk the directory tree.
+"""
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+# Store lives outside public/ — it is an intermediate, not a served fixture
+STORE_DIR = Path(__file__).parent.parent / "data" / "chapter-2" / "rides_store"
+INDEX_FILE = "_index.csv"
+INDEX_COLUMNS = ["partition", "freq", "path", "rows", "min_timestamp", "max_timestamp"]
+FREQS = ("D", "h")
+
+
+def partition_key(ts, freq):
+    """Partition key for a timestamp: '2025-09-05' (daily) or '2025-09-05 13:00' (hourly)."""
+    if freq == "D":
+        return ts.strftime("%Y-%m-%d")
+    return ts.strftime("%Y-%m-%d %H:00")
+
+
+def partition_path(ts, freq):
+    """Relative path of the Parquet file holding the partition that contains ts."""
+    parts = [f"date={ts.strftime('%Y-%m-%d')}"]
+    if freq == "h":
+        parts.append(f"hour={ts.strftime('%H')}")
+    return Path(*parts) / "part.parquet"
+
+
+def read_index(store_dir=STORE_DIR):
+    """Load the partition index (empty frame if the store does not exist yet)."""
+    index_path = Path(store_dir) / INDEX_FILE
+    if not index_path.exists():
+        return pd.DataFrame(columns=INDEX_COLUMNS)
+    return pd.read_csv(index_path, dtype={"partition": str, "freq": str, "path": str})
+
+
+def read_partition(path, store_dir=STORE_DIR):
+    """Load one partition by its index path."""
+    return pd.read_parquet(Path(store_dir) / path)
+
+
+def clear_store(store_dir=STORE_DIR):
+    """
+    Remove every partition listed in the index, then the index itself.
+
+    Only touches what the index names, so a mistyped store path can never
+    delete unrelated files. Raises ValueError if the directory holds files
+    but no index.
+    """
+    store_dir = Path(store_dir)
+    if not store_dir.exists():
+        return
+    if not (store_dir / INDEX_FILE).exists():
+        if any(store_dir.iterdir()):
+            raise ValueError(f"{store_dir} has no {INDEX_FILE}; refusing to clear it")
+        return
+
+    # Top-level date=... directories; hourly partitions share them
+    for top in {Path(path).parts[0] for path in read_index(store_dir)["path"]}:
+        if top.startswith("date="):
+            shutil.rmtree(store_dir / top, ignore_errors=True)
+    (store_dir / INDEX_FILE).unlink()
+
+
+def write_partitions(df, store_dir=STORE_DIR, freq="D"):
+    """
+    Split rides by timestamp into partitions and write them to the store.
+
+    Partitions already present are overwritten; the index is rewritten
+    atomically at the end. Returns the index rows for the partitions written.
+    """
+    if freq not in FREQS:
+        raise ValueError(f"freq must be one of {FREQS}, got {freq!r}")
+
+    store_dir = Path(store_dir)
+    index = read_index(store_dir)
+    if len(index) and set(index["freq"]) != {freq}:
+        raise ValueError(
+            f"Store {store_dir} is partitioned by {index['freq'].iloc[0]!r}, cannot write {freq!r}"
+        )
+
+    df = df.copy()
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+
+    written = []
+    for start, group in df.groupby(df["timestamp"].dt.floor(freq)):
+        rel_path = partition_path(start, freq)
+        out_path = store_dir / rel_path
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        group.sort_values("timestamp").to_parquet(out_path, index=False)
+        written.append({
+            "partition": partition_key(start, freq),
+            "freq": freq,
+            "path": rel_path.as_posix(),
+            "rows": len(group),
+            "min_timestamp": str(group["timestamp"].min()),
+            "max_timestamp": str(group["timestamp"].max()),
+        })
+
+    written = pd.DataFrame(written, columns=INDEX_COLUMNS)
+    kept = index[~index["partition"].isin(written["partition"])]
+    index = pd.concat([f for f in (kept, written) if len(f)], ignore_index=True).sort_values("partition")
+
+    store_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = store_dir / f"{INDEX_FILE}.tmp"
+    index.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, store_dir / INDEX_FILE)
+    return written